@@ -1,13 +1,22 @@
 """ Main application entry point """
 
 import uvicorn
-from src.api.app import app
+from src.config import get_settings
 
 if __name__ == "__main__":
+    settings = get_settings()
+
+    # uvicorn silently ignores workers when reloading, so refuse the combination
+    if settings.debug and settings.api_workers > 1:
+        raise SystemExit("DEBUG enables auto-reload, which runs a single worker; set API_WORKERS=1")
+
     uvicorn.run(
-        "src.api.app",
-        host: "0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+        "src.api.app:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        workers=settings.api_workers,
+        loop="uvloop",
+        http="httptools",
+        reload=settings.debug,
+        log_level=settings.log_level
+    )
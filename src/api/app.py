@@ -1,13 +1,20 @@
 """ Fast API Application setup with dependency injection"""
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 import logging
 
-from src.api.dependencies import get_embedding_service, get_vector_store, get_query_processor
+from redis.asyncio import ConnectionPool, Redis
+
+from src.config import get_settings
+from src.api.dependencies import MockEmbeddingService, MockVectorStore, MockQueryProcessor
 from src.api.routes import health, documents, queries
+from src.services.batching import BatchingEmbedder
+from src.services.cache import TwoTierCache
+from src.services.semantic_cache import SemanticCache
 
 
 # Configuration Logging
@@ -21,11 +28,41 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """ Application lifespan management"""
     logger.info("Starting RAG System application")
+    settings = get_settings()
+    app.state.settings = settings
+
+    # Process-wide connection pool, shared by every request
+    app.state.redis_pool = ConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections
+    )
+
+    # Service singletons exposed through dependencies
+    app.state.embedding_service = MockEmbeddingService()
+    app.state.vector_store = MockVectorStore()
+    app.state.query_processor = MockQueryProcessor()
+    app.state.embedding_batcher = BatchingEmbedder(
+        app.state.embedding_service,
+        batch_size=settings.embedding_batch_size,
+        flush_interval_ms=settings.embedding_flush_ms
+    )
+    await app.state.embedding_batcher.start()
+    app.state.query_cache = TwoTierCache(
+        redis=Redis(connection_pool=app.state.redis_pool),
+        l1_maxsize=settings.query_cache_l1_size,
+        l1_ttl_seconds=settings.query_cache_l1_ttl_seconds,
+        l2_ttl_seconds=settings.query_cache_ttl_seconds
+    )
+    app.state.semantic_cache = SemanticCache(
+        threshold=settings.semantic_cache_threshold,
+        ttl_seconds=settings.query_cache_ttl_seconds
+    ) if settings.semantic_cache_enabled else None
 
-    # Startup logic here
     yield
 
     # Shutdown logic here
+    await app.state.embedding_batcher.close()
+    await app.state.redis_pool.disconnect()
     logger.info("Shutting down RAG system application")
 
 def create_app() -> FastAPI:
@@ -35,7 +72,8 @@ def create_app() -> FastAPI:
         title="RAG system for GTM strategies",
         description="A production-ready RAG system",
         version="0.1.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
 
     # Add CORS middleware
@@ -55,4 +93,4 @@ def create_app() -> FastAPI:
     return app
 
 # Create the application instance
-app = create_app()
\ No newline at end of file
+app = create_app()
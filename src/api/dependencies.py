@@ -1,20 +1,55 @@
 """ Dependency injection for FastAPI """
 
-from typing import Annotated
-from fastapi import Depends
+import asyncio
+from typing import Annotated, Optional
+from fastapi import Depends, Request
+import numpy as np
 
+from src.config import Settings, get_settings
+from src.services.batching import BatchingEmbedder
+from src.services.cache import TwoTierCache
+from src.services.semantic_cache import SemanticCache
 from src.services.protocols import EmbeddingProvider, VectorStore, QueryProcessor
 
+# Dimension of text-embedding-ada-002 vectors
+EMBEDDING_DIM = 1536
+
 class MockEmbeddingService:
     """ Mock embedding service for initial setup """
 
-    async def embed_documents(self, documents: list[str]) -> list[list[float]]:
-        # Return mock embeddings
-        return [[0.1] * 1536 for _ in documents]
+    def __init__(self, max_concurrency: int = 16):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def embed_documents(self, documents: list[str]) -> np.ndarray:
+        # Return mock embeddings - one provider call for the whole list
+        return np.full((len(documents), EMBEDDING_DIM), 0.1, dtype=np.float32)
     
-    async def embed_query(self,query : str) -> list[float]:
+    async def embed_query(self,query : str) -> np.ndarray:
         # return mock embedding
-        return [0.1] * 1536
+        return np.full(EMBEDDING_DIM, 0.1, dtype=np.float32)
+
+    async def embed_batch(self, texts: list[str], batch_size: int = 64) -> np.ndarray:
+        if not texts:
+            return np.empty((0, EMBEDDING_DIM), dtype=np.float32)
+
+        # Sort longest-first so each sub-batch is length-homogeneous (less padding)
+        order = np.array(sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True))
+        ordered = [texts[i] for i in order]
+
+        # Fan sub-batches out concurrently; gather keeps results in sorted order
+        sub_batches = [ordered[start:start + batch_size] for start in range(0, len(ordered), batch_size)]
+        results = await asyncio.gather(*(self._post_batch(sub) for sub in sub_batches))
+
+        # Undo the permutation so embeddings stay aligned with texts
+        sorted_embeddings = np.concatenate(results)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+
+    async def _post_batch(self, texts: list[str]) -> np.ndarray:
+        # Bound in-flight provider calls to respect rate limits
+        async with self._semaphore:
+            return await self.embed_documents(texts)
     
 class MockVectorStore:
     """ Mock vector store for initial setup """
@@ -22,28 +57,44 @@ class MockVectorStore:
     async def add_documents(self, documents) -> None:
         pass
 
-    async def similarity_search(self, query_embedding: list[float], k: int):
+    async def similarity_search(self, query_embedding: np.ndarray, k: int):
         return []
     
 class MockQueryProcessor:
     """ Mock query processor for initial setup """
 
     async def process_query(self, context) -> str:
-        return "Mock response"
+        return f"Mock response for query: '{context.query}' with persona: {context.persona_id}"
     
-async def get_embedding_service()-> EmbeddingProvider:
-    """Get embedding service instance """
-    return MockEmbeddingService()
+async def get_embedding_service(request: Request) -> EmbeddingProvider:
+    """Get the shared embedding service instance """
+    return request.app.state.embedding_service
+
+async def get_embedding_batcher(request: Request) -> BatchingEmbedder:
+    """ Get the shared batching embedder used for ingestion """
+    return request.app.state.embedding_batcher
+
+async def get_vector_service(request: Request) -> VectorStore:
+    """ Get the shared vector store instance """
+    return request.app.state.vector_store
+
+async def get_query_processor(request: Request) -> QueryProcessor:
+    """Get the shared query processor instance"""
+    return request.app.state.query_processor
 
-async def get_vector_service() -> VectorStore:
-    """ Get vector store instance """
-    return MockVectorStore()
+async def get_query_cache(request: Request) -> TwoTierCache:
+    """ Get the process-wide query response cache """
+    return request.app.state.query_cache
 
-async def get_query_processor() -> QueryProcessor:
-    """Get query processor instance"""
-    return MockQueryProcessor()
+async def get_semantic_cache(request: Request) -> Optional[SemanticCache]:
+    """ Get the process-wide semantic cache, or None when disabled """
+    return request.app.state.semantic_cache
 
 # Type aliases for dependency injection
+SettingsDep = Annotated[Settings, Depends(get_settings)]
 EmbeddingServiceDep = Annotated[EmbeddingProvider, Depends(get_embedding_service)]
+EmbeddingBatcherDep = Annotated[BatchingEmbedder, Depends(get_embedding_batcher)]
 VectorStoreDep = Annotated[VectorStore, Depends(get_vector_service)]
-QueryProcessorDep = Annotated[QueryProcessor, Depends(get_embedding_service)]
\ No newline at end of file
+QueryProcessorDep = Annotated[QueryProcessor, Depends(get_query_processor)]
+QueryCacheDep = Annotated[TwoTierCache, Depends(get_query_cache)]
+SemanticCacheDep = Annotated[Optional[SemanticCache], Depends(get_semantic_cache)]
@@ -1,34 +1,76 @@
 """ Document management endpoints """
 
+import asyncio
+import codecs
+
 from fastapi import HTTPException, APIRouter, UploadFile, File
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import BinaryIO, List, Tuple
 
-from src.api.dependencies import EmbeddingServiceDep, VectorStoreDep
+from src.api.dependencies import EmbeddingBatcherDep, EmbeddingServiceDep, VectorStoreDep
+from src.models.core import ChunkIterator, Document, content_hasher
 
 router = APIRouter()
 
+# Upper bound on texts per batch request, matches one provider sub-batch
+MAX_EMBED_BATCH = 64
+
+# Block size for streaming uploads
+UPLOAD_READ_SIZE = 64 * 1024
+
 class DocumentUploadResponse(BaseModel):
     """ Response for document upload """
     document_id: str
     status: str
     message: str
 
+class EmbedBatchRequest(BaseModel):
+    """ Request for batch embedding """
+    texts: List[str] = Field(..., min_length=1, max_length=MAX_EMBED_BATCH, description="Texts to embed in one call")
+
+class EmbedBatchResponse(BaseModel):
+    """ Response for batch embedding, embeddings aligned with request texts """
+    embeddings: List[List[float]]
+    count: int
+
+def _consume_upload(fp: BinaryIO) -> Tuple[str, str]:
+    """ Read an upload block by block, returning its decoded text and content hash """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    hasher = content_hasher()
+    pieces: List[str] = []
+    while chunk := fp.read(UPLOAD_READ_SIZE):
+        hasher.update(chunk)
+        pieces.append(decoder.decode(chunk))
+    pieces.append(decoder.decode(b'', final=True))
+    return ''.join(pieces), hasher.hexdigest()
+
 @router.post("/upload", response_model=DocumentUploadResponse)
-async def upload_document(file: UploadFile = File(...),embedding_service: EmbeddingServiceDep = None, vector_store: VectorStoreDep = None):
+async def upload_document(file: UploadFile = File(...),embedding_batcher: EmbeddingBatcherDep = None, vector_store: VectorStoreDep = None):
     """ Upload and process a document """
     try:
-        # Read file content
-        content = await file.read()
-        text_content = content.decode('utf-8')
+        # Read, decode and hash in a worker thread so large uploads never block the event loop
+        text_content, content_hash = await asyncio.to_thread(_consume_upload, file.file)
 
-        # This is a placeholder  - actual implementation will be in later tasks
-        document_id = f"doc_{hash(text_content)}"
+        # Content-addressed id, stable across processes and reusable as the embedding cache key
+        document_id = f"doc_{content_hash[:32]}"
+
+        # Chunks from concurrent uploads share provider batches through the batcher
+        chunks = list(ChunkIterator(text_content))
+        embeddings = await embedding_batcher.submit_many([chunk.content for chunk in chunks])
+        await vector_store.add_documents([
+            Document(
+                id=f"{document_id}_{chunk.chunk_id}",
+                content=chunk.content,
+                metadata={"document_id": document_id, "filename": file.filename, "start_pos": chunk.start_pos, "end_pos": chunk.end_pos},
+                embedding=embedding
+            )
+            for chunk, embedding in zip(chunks, embeddings)
+        ])
 
         return DocumentUploadResponse(
             document_id=document_id,
-            status="accepted",
-            message="Document upload accepted for processing"
+            status="stored",
+            message=f"Document stored: {len(chunks)} chunk(s) embedded and indexed"
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to upload document: {str(e)}")
@@ -37,4 +79,14 @@ async def upload_document(file: UploadFile = File(...),embedding_service: Embedd
 async def list_documents():
     """List uploaded documents"""
     #Placeholder implementation
-    return {"documents":[], "total":0}
\ No newline at end of file
+    return {"documents":[], "total":0}
+
+@router.post("/batch", response_model=EmbedBatchResponse)
+async def embed_batch(request: EmbedBatchRequest, embedding_service: EmbeddingServiceDep = None):
+    """ Embed a batch of texts with a single provider call """
+    try:
+        embeddings = await embedding_service.embed_batch(request.texts, batch_size=MAX_EMBED_BATCH)
+
+        return EmbedBatchResponse(embeddings=embeddings.tolist(), count=len(embeddings))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to embed batch: {str(e)}")
@@ -1,8 +1,9 @@
 """ Health Check endpoints """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 from datetime import datetime, UTC
+import orjson
 
 router = APIRouter()
 
@@ -12,20 +13,24 @@ class HealthResponse(BaseModel):
     timestamp: datetime
     version: str
 
+# Probes hit these endpoints constantly, so the static part of each payload is
+# serialized once at import and only the timestamp is rendered per request
+_HEALTHY_PREFIX = orjson.dumps({"status": "healthy", "version": "0.1.0"})[:-1] + b',"timestamp":"'
+_READY_PREFIX = orjson.dumps({"status": "ready", "version": "0.1.0"})[:-1] + b',"timestamp":"'
+
+def _probe_response(prefix: bytes) -> Response:
+    return Response(
+        # 'Z' suffix, matching how Pydantic serializes UTC datetimes
+        content=prefix + datetime.now(UTC).isoformat().replace("+00:00", "Z").encode() + b'"}',
+        media_type="application/json"
+    )
+
 @router.get("/", response_model=HealthResponse)
 async def health_check():
     """Basic health check endpoint"""
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now(UTC)
-        version="0.1.0"
-    )
+    return _probe_response(_HEALTHY_PREFIX)
 
 @router.get("/ready", response_model=HealthResponse)
 async def readiness_check():
     """Readiness check for kubernetes"""
-    return HealthResponse(
-        status="ready",
-        timestamp=datetime.now(UTC),
-        version="0.1.0"
-    )
\ No newline at end of file
+    return _probe_response(_READY_PREFIX)
@@ -1,8 +1,15 @@
 """ Query processing endpoints """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from src.models.api import QueryRequest, QueryResponse
-from src.api.dependencies import QueryProcessorDep
+from src.models.core import QueryContext
+from src.api.dependencies import (
+    EmbeddingServiceDep,
+    QueryProcessorDep,
+    QueryCacheDep,
+    SemanticCacheDep
+)
+from src.services.cache import query_cache_key
 import time
 
 router = APIRouter()
@@ -10,25 +17,61 @@ router = APIRouter()
 @router.post("/", response_model=QueryResponse)
 async def process_query(
     request: QueryRequest,
-    query_processor: QueryProcessorDep = None
+    query_processor: QueryProcessorDep = None,
+    query_cache: QueryCacheDep = None,
+    semantic_cache: SemanticCacheDep = None,
+    embedding_service: EmbeddingServiceDep = None
 ):
     """Process a query with persona context"""
     try:
         start_time = time.time()
-        # This is a placeholder - actual implementation will be in later phase
-        response_text = f"Mock response for query: '{request.query}' with persona: {request.persona}"
+        context = QueryContext(
+            query=request.query,
+            persona_id=request.persona,
+            filter=request.filters or {},
+            max_results=request.max_results
+        )
+
+        # Identical queries skip the embedding + generation round-trip
+        cache_key = query_cache_key(context)
+        response_text = await query_cache.get(cache_key)
+        query_embedding = None
+
+        # Near-duplicate phrasings are served from the semantic cache
+        if response_text is None and semantic_cache is not None:
+            query_embedding = await embedding_service.embed_query(context.query)
+            response_text = semantic_cache.lookup(context, query_embedding)
+            if response_text is not None:
+                await query_cache.set(cache_key, response_text)
+
+        cache_status = "MISS" if response_text is None else "HIT"
+
+        if response_text is None:
+            response_text = await query_processor.process_query(context)
+            await query_cache.set(cache_key, response_text)
+            if query_embedding is not None:
+                semantic_cache.store(context, query_embedding, response_text)
+
         processing_time = int((time.time() - start_time) * 1000)
 
-        return QueryResponse(
+        query_response = QueryResponse(
             answer=response_text,
             confidence=0.85,
             sources=[],
             persona_context=f"Response tailored for {request.persona}",
             processing_time_ms=processing_time
         )
-    
+
+        # The model was validated on construction - serialize it directly with its
+        # compiled serializer instead of letting FastAPI re-validate and re-encode it
+        return Response(
+            content=query_response.model_dump_json(),
+            media_type="application/json",
+            headers={"X-Cache": cache_status}
+        )
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process query : {str(e)}")
-    
+
 
 
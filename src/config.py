@@ -1,6 +1,7 @@
 """ Configuration management for RAG System """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -29,6 +30,14 @@ class Settings(BaseSettings):
 
     # Redis Configuration
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
+    redis_max_connections: int = Field(default=100, env="REDIS_MAX_CONNECTIONS")
+
+    # Query Cache Configuration
+    query_cache_l1_size: int = Field(default=1024, env="QUERY_CACHE_L1_SIZE")
+    query_cache_l1_ttl_seconds: float = Field(default=300.0, env="QUERY_CACHE_L1_TTL_SECONDS")
+    query_cache_ttl_seconds: int = Field(default=3600, env="QUERY_CACHE_TTL_SECONDS")
+    semantic_cache_enabled: bool = Field(default=False, env="SEMANTIC_CACHE_ENABLED")
+    semantic_cache_threshold: float = Field(default=0.95, env="SEMANTIC_CACHE_THRESHOLD")
 
     # Rate-Limiting Configuration
     rate_limit_requests_per_minute: int = Field(default=60, env="RATE_LIMIT_REQUESTS_PER_MINUTE")
@@ -48,10 +57,16 @@ class Settings(BaseSettings):
     openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
     openai_model: str = Field(default="text-embedding-ada-002", env="OPENAI_MODEL")
 
+    # Embedding request batching (document ingestion)
+    embedding_batch_size: int = Field(default=32, env="EMBEDDING_BATCH_SIZE")
+    embedding_flush_ms: float = Field(default=50.0, env="EMBEDDING_FLUSH_MS")
+
     model_config = {
         "env_file":".env",
         "env_file_encoding":"utf-8"
     }
 
-#Global setting instance
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """ Load settings on first use and reuse them for the life of the process """
+    return Settings()
@@ -1,12 +1,32 @@
 """ Pydantic models for API Validation """
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Optional, Dict, Any, Union
-from .core import PersonaType
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import List, Optional, Dict, Any
 from datetime import datetime, UTC
 import re
 from .core import PersonaType
 
+# Compiled once at import - validators run on every request
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Basic SQL injection patterns combined into a single alternation (one scan per query).
+# Block comments are checked separately: '/\*.*\*/' backtracks quadratically on
+# inputs with many '/*' openers, while two str.find calls stay linear.
+_SQL_INJECTION_RE = re.compile(
+    r'\b(DROP|DELETE|INSERT|UPDATE|ALTER|CREATE)\b'
+    r'|[;\'"\\]'
+    r'|--',
+    re.IGNORECASE
+)
+
+# Fields every QueryResponse source must carry
+_REQUIRED_SOURCE_FIELDS = frozenset({'id', 'title', 'relevance_score'})
+
+def _contains_block_comment(text: str) -> bool:
+    """ Detect a '/* ... */' block comment in single-line text in linear time """
+    start = text.find('/*')
+    return start != -1 and text.find('*/', start + 2) != -1
+
 class QueryRequest(BaseModel):
     """Pydantic model for API Requests with business logic validation"""
     query: str = Field(..., min_length=1, max_length=1000, description="User query text")
@@ -14,14 +34,19 @@ class QueryRequest(BaseModel):
     filters: Optional[Dict[str,Any]] = Field(None, description="Optional filters for document retrieval")
     max_results: int = Field(default=10, ge=1,le=50, description="Maximum number of results to return")
 
-    model_config = {"use_enum_values": True}
+    model_config = ConfigDict(
+        frozen=True,
+        str_strip_whitespace=True,
+        validate_assignment=False,
+        use_enum_values=True
+    )
 
     @field_validator('query')
     @classmethod
     def validate_query_content(cls, v: str) -> str:
         """ Validate query content for business logic constraints """
         # Remove excessive whitespace
-        cleaned_query = re.sub(r'\s+',' ', v.strip())
+        cleaned_query = _WHITESPACE_RE.sub(' ', v.strip())
 
         if not cleaned_query:
             raise ValueError("Query cannot be empty or only whitespace")
@@ -31,20 +56,12 @@ class QueryRequest(BaseModel):
             raise ValueError("Query must contain at least 2 words for meaningful results")
         
         # Check for potentially harmful content ( basic SQL injection patterns)
-        sql_patterns = [
-            r'\b(DROP|DELETE|INSERT|UPDATE|ALTER|CREATE)\b',
-            r'[;\'"\\]',
-            r'--',
-            r'/\*.*\*/'
-        ]
-
-        for pattern in sql_patterns:
-            if re.search(pattern, cleaned_query, re.IGNORECASE):
-                raise ValueError("Query contains potentially harmful content")
+        if _SQL_INJECTION_RE.search(cleaned_query) or _contains_block_comment(cleaned_query):
+            raise ValueError("Query contains potentially harmful content")
         
         return cleaned_query
     
-    @field_validator('filter')
+    @field_validator('filters')
     @classmethod
     def validate_filters(cls, v:Optional[Dict[str, Any]]) -> Optional[Dict[str,Any]]:
         """ Validate filter structure and content """
@@ -105,7 +122,9 @@ class QueryResponse(BaseModel):
     sources: List[Dict[str,Any]] = Field(..., description="Source documents used for the answer")
     persona_context: str = Field(...,description="Persona-specific context applied")
     processing_time_ms: int = Field(..., ge=0, description="Processing time in milliseconds")
-    timestamp: datetime = Field(default_factory=datetime.now(UTC), description="Response timestamp")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC), description="Response timestamp")
+
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
 
     @field_validator('answer')
     @classmethod
@@ -128,28 +147,20 @@ class QueryResponse(BaseModel):
     @classmethod
     def validate_sources_structure(cls, v: List[Dict[str,Any]]) -> List[Dict[str,Any]]:
         """ Validate source documents structure """
-        if not isinstance(v, list):
-            raise ValueError("Sources must be a list")
-        
-        required_score_fields = {'id','title','relevance_score'}
-
+        # Pydantic has already enforced List[Dict[str, Any]] - only the contents need checking
         for i, source in enumerate(v):
-            if not isinstance(source, dict):
-                raise ValueError(f"Source {i} must be a dictionary")
-            
-            # Check required fields
-            missing_fields = required_score_fields - set(source.keys())
-            if missing_fields:
-                raise ValueError(f"Source {i} missing required fields: {missing_fields}")
-            
+            # Check required fields, building the missing set only on failure
+            if not source.keys() >= _REQUIRED_SOURCE_FIELDS:
+                missing_fields = _REQUIRED_SOURCE_FIELDS - source.keys()
+                raise ValueError(f"Source {i} missing required fields: {set(missing_fields)}")
+
             # Validate relevant score
-            if 'relevance_score' in source:
-                score = source['relevance_score']
-                if not isinstance(score, (int, float)) or not (0.0 <= score <= 1.0):
-                    raise ValueError(f"Source {i} relevance_score must be between 0.0 and 1.0")
-        
+            score = source['relevance_score']
+            if not isinstance(score, (int, float)) or not (0.0 <= score <= 1.0):
+                raise ValueError(f"Source {i} relevance_score must be between 0.0 and 1.0")
+
         return v
-    
+
     @field_validator('confidence')
     @classmethod
     def validate_confidence_reasonableness(cls, v: float)-> float:
@@ -1,9 +1,17 @@
 """ Core data models with memory optimization """
 
 from typing import Protocol, Optional, AsyncIterator, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from enum import Enum
+import hashlib
+import itertools
+
+import numpy as np
+
+def content_hasher() -> "hashlib._Hash":
+    """Incremental hasher for content-addressed document ids and cache keys"""
+    return hashlib.blake2b(digest_size=32)
 
 @dataclass(slots=True)
 class Document:
@@ -11,7 +19,7 @@ class Document:
     id: str
     content: str
     metadata: Dict[str,Any]
-    embedding: Optional[List[float]] = None
+    embedding: Optional[np.ndarray] = None # float32 vector
 
 @dataclass(slots=True)
 class QueryContext:
@@ -30,25 +38,30 @@ class PersonaType(str, Enum):
 
 @dataclass(slots=True, frozen=True)
 class EmbeddingCacheKey:
-    """Immutable cache key for embedding"""
+    """Immutable cache key for embedding, content_hash is a content_hasher() hexdigest"""
     content_hash: str
     model_version: str
+    _hash: int = field(init=False, repr=False, compare=False)
     
-    def __post__init(self):
+    def __post_init__(self):
         # Validate cache key format
         if not self.content_hash or not self.model_version:
             raise ValueError("Cache key components cannot be empty")
 
-class DocumentChunk:
-    """Memory-optimized document chunk with __slots__"""
-    __slots__ = ('chunk_id', 'content', 'start_pos', 'end_pos', 'embedding')
+        # Hash once - keys are probed far more often than they are built
+        object.__setattr__(self, '_hash', hash((self.content_hash, self.model_version)))
+
+    def __hash__(self) -> int:
+        return self._hash
 
-    def __init__(self, chunk_id: str, content: str, start_pos: int, end_pos: int):
-        self.chunk_id = chunk_id
-        self.content = content
-        self.start_pos = start_pos
-        self.end_pos = end_pos
-        self.embedding: Optional[List[float]] = None
+@dataclass(slots=True)
+class DocumentChunk:
+    """Memory-optimized document chunk"""
+    chunk_id: str
+    content: str
+    start_pos: int
+    end_pos: int
+    embedding: Optional[np.ndarray] = None # float32 vector
 
 class ChunkIterator:
     """Iterator for lazy chunk processing"""
@@ -60,6 +73,10 @@ class ChunkIterator:
     
     def __iter__(self):
         return self
+
+    def batch_iter(self, n: int) -> List[DocumentChunk]:
+        """Return up to the next n chunks at once, sized to feed one batch embedding call"""
+        return list(itertools.islice(self, n))
     
     def __next__(self) -> DocumentChunk:
         if self.position >= len(self.document):
@@ -2,18 +2,18 @@
 
 from typing import Optional
 from datetime import datetime, UTC
-import uuid
+import secrets
 
 def generate_correlation_id() -> str:
     """Generate a unique correlation ID"""
-    return str(uuid.uuid4())
+    return secrets.token_hex(16)
 
 class RAGSystemError(Exception):
     """Base exception for all RAG system errors """
 
     def __init__(self, message: str, correlation_id: Optional[str]= None):
         super().__init__(message)
-        self.correlation_id = correlation_id or generate_correlation_id
+        self.correlation_id = correlation_id or generate_correlation_id()
         self.timestamp = datetime.now(UTC)
 
 class DocumentProcessingError(RAGSystemError):
@@ -1,4 +1,85 @@
+# Monthly query_history partitions (query_history_pYYYYMM) for the current and
+# next month. Idempotent; AsyncDatabase.ensure_partitions() runs it on connect and then periodically,
+# so the next month always exists before its first row arrives. Rows that already
+# landed in the default partition for a missing month are moved into the new
+# partition, since PostgreSQL refuses to add a partition whose range the default
+# partition still holds rows for.
+QUERY_HISTORY_PARTITIONS_SQL = """
+DO $$
+DECLARE
+    month_start DATE;
+    month_end DATE;
+    partition_name TEXT;
+BEGIN
+    -- A pre-partitioning query_history is converted by MIGRATIONS; nothing to do until then
+    IF NOT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('query_history')) THEN
+        RETURN;
+    END IF;
+
+    -- Serialize workers running this at the same time
+    PERFORM pg_advisory_xact_lock(hashtext('query_history_partitions'));
+
+    FOR i IN 0..1 LOOP
+        month_start := date_trunc('month', CURRENT_DATE) + make_interval(months => i);
+        month_end := (month_start + INTERVAL '1 month')::date;
+        partition_name := 'query_history_p' || to_char(month_start, 'YYYYMM');
+
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+        -- Hold off inserts routed to the default partition until the new
+        -- partition is attached; a row for this month landing there after the
+        -- move would make ATTACH fail
+        LOCK TABLE query_history_default IN ACCESS EXCLUSIVE MODE;
+        EXECUTE format(
+            'CREATE TABLE %I (LIKE query_history INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+            partition_name
+        );
+        EXECUTE format(
+            'WITH moved AS (
+                DELETE FROM query_history_default
+                WHERE created_at >= %L AND created_at < %L
+                RETURNING *
+            )
+            INSERT INTO %I SELECT * FROM moved',
+            month_start, month_end, partition_name
+        );
+        EXECUTE format(
+            'ALTER TABLE query_history ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, month_start, month_end
+        );
+    END LOOP;
+END $$;
+"""
+
+# Query history table, shared by SCHEMA_SQL and the migration that partitions it
+QUERY_HISTORY_SQL = """
+-- Query history table, partitioned by month so recency queries and inserts
+-- only touch the latest partition and its (small) indexes
+CREATE TABLE IF NOT EXISTS query_history (
+    id SERIAL,
+    query TEXT NOT NULL,
+    persona_id VARCHAR(100),
+    response TEXT,
+    confidence FLOAT,
+    processing_time_ms INTEGER,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Catches rows outside any monthly partition so inserts never fail
+CREATE TABLE IF NOT EXISTS query_history_default PARTITION OF query_history DEFAULT;
+
+-- Create index on persona_id for analytics
+CREATE INDEX IF NOT EXISTS idx_query_history_persona ON query_history (persona_id);
+
+-- Create index on created_at for time-based queries
+CREATE INDEX IF NOT EXISTS idx_query_history_created_at ON query_history (created_at);
+"""
+
 SCHEMA_SQL = """
+-- pgvector for the embedding column type and similarity operators
+CREATE EXTENSION IF NOT EXISTS vector;
+
 -- Documents table
 CREATE TABLE IF NOT EXISTS documents (
     id VARCHAR(255) PRIMARY KEY,
@@ -15,28 +96,13 @@ CREATE INDEX IF NOT EXISTS idx_documents_metadata ON documents USING GIN (metada
 -- Create index on created_at for time-based queries
 CREATE INDEX IF NOT EXISTS idx_documents_created_at ON documents (created_at);
 
--- Query history table
-CREATE TABLE IF NOT EXISTS query_history (
-    id SERIAL PRIMARY KEY,
-    query TEXT NOT NULL,
-    persona_id VARCHAR(100),
-    response TEXT,
-    confidence FLOAT,
-    processing_time_ms INTEGER,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
-
--- Create index on persona_id for analytics
-CREATE INDEX IF NOT EXISTS idx_query_history_persona ON query_history (persona_id);
-
--- Create index on created_at for time-based queries
-CREATE INDEX IF NOT EXISTS idx_query_history_created_at ON query_history (created_at);
-
--- Embeddings cache table
-CREATE TABLE IF NOT EXISTS embeddings_cache (
-    content_hash VARCHAR(64) PRIMARY KEY,
+""" + QUERY_HISTORY_SQL + """
+-- Embeddings cache table. UNLOGGED: it is a cache, so skipping WAL halves
+-- write volume and losing its contents on a crash is acceptable
+CREATE UNLOGGED TABLE IF NOT EXISTS embeddings_cache (
+    content_hash BYTEA PRIMARY KEY, -- raw 32-byte content_hasher() digest
     model_version VARCHAR(50) NOT NULL,
-    embedding FLOAT[] NOT NULL,
+    embedding vector(1536) NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     accessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     access_count INTEGER DEFAULT 1
@@ -47,4 +113,73 @@ CREATE INDEX IF NOT EXISTS idx_embeddings_cache_model ON embeddings_cache (model
 
 -- Create index on accessed_at for cache eviction
 CREATE INDEX IF NOT EXISTS idx_embeddings_cache_accessed ON embeddings_cache (accessed_at);
+
+-- Create HNSW index for cosine similarity search
+CREATE INDEX IF NOT EXISTS idx_embeddings_cache_embedding ON embeddings_cache USING hnsw (embedding vector_cosine_ops);
 """
+
+# Tracks which MIGRATIONS an existing database has applied
+SCHEMA_VERSION_SQL = "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)"
+
+# (version, sql) steps bringing a database created by an older SCHEMA_SQL up to
+# date, applied in order once each. A fresh database gets SCHEMA_SQL instead and
+# starts at SCHEMA_VERSION. Each step is also safe to re-run, since databases
+# from before versioning start at version 0.
+MIGRATIONS = [
+    (1, """
+    -- Partition query_history by month. PostgreSQL cannot partition a table in
+    -- place, so copy the rows into a new partitioned table and swap it in.
+    DO $$
+    BEGIN
+        IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'query_history'::regclass) THEN
+            RETURN;
+        END IF;
+
+        ALTER TABLE query_history RENAME TO query_history_unpartitioned;
+        DROP INDEX IF EXISTS idx_query_history_persona;
+        DROP INDEX IF EXISTS idx_query_history_created_at;
+        """ + QUERY_HISTORY_SQL + """
+        INSERT INTO query_history (id, query, persona_id, response, confidence, processing_time_ms, created_at)
+        SELECT id, query, persona_id, response, confidence, processing_time_ms, coalesce(created_at, CURRENT_TIMESTAMP)
+        FROM query_history_unpartitioned;
+        PERFORM setval(
+            pg_get_serial_sequence('query_history', 'id'),
+            (SELECT coalesce(max(id), 0) + 1 FROM query_history),
+            false
+        );
+        DROP TABLE query_history_unpartitioned;
+    END $$;
+    """),
+    (2, """
+    -- embeddings_cache is a cache; stop writing WAL for it
+    ALTER TABLE embeddings_cache SET UNLOGGED;
+    """),
+    (3, """
+    -- Store embeddings as pgvector vectors (FLOAT[] before) with an HNSW index
+    CREATE EXTENSION IF NOT EXISTS vector;
+    DO $$
+    BEGIN
+        IF (
+            SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+            WHERE attrelid = 'embeddings_cache'::regclass AND attname = 'embedding'
+        ) <> 'vector(1536)' THEN
+            ALTER TABLE embeddings_cache ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536);
+        END IF;
+    END $$;
+    CREATE INDEX IF NOT EXISTS idx_embeddings_cache_embedding ON embeddings_cache USING hnsw (embedding vector_cosine_ops);
+    """),
+    (4, """
+    -- Key embeddings_cache by the raw 32-byte digest instead of its hex text
+    DO $$
+    BEGIN
+        IF (
+            SELECT atttypid FROM pg_attribute
+            WHERE attrelid = 'embeddings_cache'::regclass AND attname = 'content_hash'
+        ) <> 'bytea'::regtype THEN
+            ALTER TABLE embeddings_cache ALTER COLUMN content_hash TYPE BYTEA USING decode(content_hash, 'hex');
+        END IF;
+    END $$;
+    """),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
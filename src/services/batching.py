@@ -0,0 +1,120 @@
+""" Request batching for embedding providers """
+
+import asyncio
+import logging
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.services.protocols import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+class BatchingEmbedder:
+    """
+    Coalesces individual embedding requests into provider batches.
+
+    Callers submit single texts; a background task collects them until either
+    `batch_size` texts are queued or `flush_interval_ms` has passed since the
+    first one arrived, then issues one `embed_batch` call for the whole group.
+    This trades a bounded amount of latency for far fewer provider calls, so it
+    suits throughput-sensitive paths such as document ingestion. With
+    `batch_size=1` requests bypass the queue entirely.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        batch_size: int = 32,
+        flush_interval_ms: float = 50.0
+    ):
+        self._provider = provider
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._queue: "asyncio.Queue[Tuple[str, asyncio.Future]]" = asyncio.Queue()
+        self._collector: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """ Start the background collector """
+        if self._collector is None and self._batch_size > 1:
+            self._collector = asyncio.create_task(self._collect())
+
+    async def close(self) -> None:
+        """ Stop collecting and flush everything still queued """
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+
+        pending: List[Tuple[str, asyncio.Future]] = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for start in range(0, len(pending), self._batch_size):
+            await self._flush(pending[start:start + self._batch_size])
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
+
+    async def submit(self, text: str) -> np.ndarray:
+        """ Embed a single text as part of the next batch """
+        if self._collector is None:
+            embeddings = await self._provider.embed_batch([text], batch_size=1)
+            return embeddings[0]
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def submit_many(self, texts: List[str]) -> List[np.ndarray]:
+        """ Embed several texts, letting them share batches with other callers """
+        return list(await asyncio.gather(*(self.submit(text) for text in texts)))
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[str, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self._flush_interval
+
+                while len(batch) < self._batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Flush in the background so the next batch starts collecting immediately
+                self._spawn_flush(batch)
+                batch = []
+        except asyncio.CancelledError:
+            # Stopped by close(): don't strand callers waiting on a partly collected batch
+            if batch:
+                self._spawn_flush(batch)
+            raise
+
+    def _spawn_flush(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        task = asyncio.create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            embeddings = await self._provider.embed_batch(texts, batch_size=len(texts))
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(texts)} failed: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
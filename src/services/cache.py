@@ -0,0 +1,99 @@
+""" Two-tier caching for query responses """
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from redis import RedisError
+from redis.asyncio import Redis
+
+from src.models.core import QueryContext
+
+logger = logging.getLogger(__name__)
+
+def query_cache_key(context: QueryContext) -> bytes:
+    """ Build a stable cache key from the normalized query, persona and filters """
+    payload = f"{context.query.lower()}|{context.persona_id}|{json.dumps(context.filter, sort_keys=True)}"
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+class TwoTierCache:
+    """
+    Two-tier cache for generated responses.
+
+    L1 is an in-process LRU with a short TTL that serves hot queries without
+    leaving the worker. L2 is Redis, shared by every worker and replica.
+    Redis failures degrade to a cache miss instead of failing the request.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        l1_maxsize: int = 1024,
+        l1_ttl_seconds: float = 300.0,
+        l2_ttl_seconds: int = 3600,
+        namespace: str = "query"
+    ):
+        self._redis = redis
+        self._l1: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+        self._l1_maxsize = l1_maxsize
+        self._l1_ttl_seconds = l1_ttl_seconds
+        self._l2_ttl_seconds = l2_ttl_seconds
+        self._prefix = f"{namespace}:".encode("utf-8")
+
+    async def get(self, key: bytes) -> Optional[str]:
+        """ Look up a key in L1, then L2; L2 hits are promoted to L1 """
+        value = self._l1_get(key)
+        if value is not None:
+            return value
+
+        if self._redis is None:
+            return None
+
+        try:
+            raw = await self._redis.get(self._prefix + key)
+        except RedisError as e:
+            logger.warning(f"L2 cache lookup failed: {str(e)}")
+            return None
+
+        if raw is None:
+            return None
+
+        value = raw.decode("utf-8")
+        self._l1_set(key, value)
+        return value
+
+    async def set(self, key: bytes, value: str) -> None:
+        """ Store a value in both tiers """
+        self._l1_set(key, value)
+
+        if self._redis is None:
+            return
+
+        try:
+            await self._redis.setex(self._prefix + key, self._l2_ttl_seconds, value.encode("utf-8"))
+        except RedisError as e:
+            logger.warning(f"L2 cache write failed: {str(e)}")
+
+    def _l1_get(self, key: bytes) -> Optional[str]:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._l1[key]
+            return None
+
+        self._l1.move_to_end(key)
+        return value
+
+    def _l1_set(self, key: bytes, value: str) -> None:
+        self._l1[key] = (time.monotonic() + self._l1_ttl_seconds, value)
+        self._l1.move_to_end(key)
+
+        # Evict least recently used entries beyond capacity
+        while len(self._l1) > self._l1_maxsize:
+            self._l1.popitem(last=False)
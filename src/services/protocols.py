@@ -1,17 +1,24 @@
 """ Protocol definitions for service interfaces """
 
 from typing import Protocol, List, AsyncIterator
+
+import numpy as np
+
 from src.models.core import Document, QueryContext
 
 class EmbeddingProvider(Protocol):
     """ Protocol for embedding service """
 
-    async def embed_documents(self, documents: List[str]) -> List[List[float]]:
-        """ Generate embeddings for a list of documents """
+    async def embed_documents(self, documents: List[str]) -> np.ndarray:
+        """ Generate a (len(documents), dim) float32 embedding matrix for a list of documents """
+        ...
+
+    async def embed_query(self, query:str) -> np.ndarray:
+        """ Generate a float32 embedding vector for a single query"""
         ...
 
-    async def embed_query(self, query:str) -> List[float]:
-        """ Generate embedding for a single query"""
+    async def embed_batch(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """ Generate embeddings for many texts, one provider call per sub-batch, aligned by index """
         ...
 
 class VectorStore(Protocol):
@@ -21,7 +28,7 @@ class VectorStore(Protocol):
         """ Add documents with embedding to the vector store """
         ...
 
-    async def similarity_search(self, query_embedding: List[float], k: int) -> List[Document]:
+    async def similarity_search(self, query_embedding: np.ndarray, k: int) -> List[Document]:
         """ Perform similarity search and return top k documents"""
         ...
 
@@ -0,0 +1,138 @@
+""" LSH-based semantic cache for near-duplicate queries """
+
+import itertools
+import json
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.models.core import QueryContext
+
+@dataclass(slots=True)
+class _Entry:
+    """ Cached answer with its normalized query embedding """
+    embedding: np.ndarray
+    scope: str
+    answer: str
+    signatures: Tuple[int, ...]
+    expires_at: float
+
+def _scope(context: QueryContext) -> str:
+    # Answers are only reusable for the same persona and filters
+    return f"{context.persona_id}|{json.dumps(context.filter, sort_keys=True)}"
+
+class SemanticCache:
+    """
+    Semantic cache keyed by query embedding.
+
+    Uses random-projection LSH: each of `num_tables` tables hashes an embedding
+    to a `num_bits`-bit signature (sign of its projection onto random planes).
+    Similar queries land in the same bucket in at least one table, so a lookup
+    only computes exact cosine similarity for a handful of candidates.
+    """
+
+    def __init__(
+        self,
+        dim: int = 1536,
+        num_tables: int = 8,
+        num_bits: int = 16,
+        threshold: float = 0.95,
+        max_candidates: int = 32,
+        max_entries: int = 10000,
+        ttl_seconds: float = 3600.0,
+        seed: int = 0
+    ):
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((num_tables * num_bits, dim)).astype(np.float32)
+        self._bit_weights = np.left_shift(np.uint64(1), np.arange(num_bits, dtype=np.uint64))
+        self._num_tables = num_tables
+        self._num_bits = num_bits
+        self._threshold = threshold
+        self._max_candidates = max_candidates
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._tables: List[Dict[int, List[int]]] = [defaultdict(list) for _ in range(num_tables)]
+        self._entries: Dict[int, _Entry] = {}
+        self._ids = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, context: QueryContext, embedding: np.ndarray) -> Optional[str]:
+        """ Return a cached answer for a cosine-similar query, if any """
+        vector = self._normalize(embedding)
+        signatures = self._signatures(vector)
+        scope = _scope(context)
+        now = time.monotonic()
+
+        candidate_ids: List[int] = []
+        expired_ids: List[int] = []
+        seen = set()
+        for table, signature in zip(self._tables, signatures):
+            for entry_id in table.get(signature, ()):
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                entry = self._entries[entry_id]
+                if entry.expires_at < now:
+                    expired_ids.append(entry_id)
+                elif entry.scope == scope:
+                    candidate_ids.append(entry_id)
+                if len(candidate_ids) >= self._max_candidates:
+                    break
+            if len(candidate_ids) >= self._max_candidates:
+                break
+
+        # Evict after scanning: eviction removes ids from the buckets being iterated
+        for entry_id in expired_ids:
+            self._evict(entry_id)
+
+        if not candidate_ids:
+            return None
+
+        matrix = np.stack([self._entries[entry_id].embedding for entry_id in candidate_ids])
+        similarities = matrix @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self._threshold:
+            return None
+        return self._entries[candidate_ids[best]].answer
+
+    def store(self, context: QueryContext, embedding: np.ndarray, answer: str) -> None:
+        """ Cache an answer under the query embedding """
+        vector = self._normalize(embedding)
+        signatures = self._signatures(vector)
+        entry_id = next(self._ids)
+
+        self._entries[entry_id] = _Entry(
+            embedding=vector,
+            scope=_scope(context),
+            answer=answer,
+            signatures=signatures,
+            expires_at=time.monotonic() + self._ttl_seconds
+        )
+        for table, signature in zip(self._tables, signatures):
+            table[signature].append(entry_id)
+
+        # Evict oldest entries beyond capacity (dicts keep insertion order)
+        while len(self._entries) > self._max_entries:
+            self._evict(next(iter(self._entries)))
+
+    def _normalize(self, embedding: np.ndarray) -> np.ndarray:
+        vector = embedding.astype(np.float32, copy=False)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _signatures(self, vector: np.ndarray) -> Tuple[int, ...]:
+        bits = (self._planes @ vector > 0).reshape(self._num_tables, self._num_bits)
+        return tuple(int(signature) for signature in bits.astype(np.uint64) @ self._bit_weights)
+
+    def _evict(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        for table, signature in zip(self._tables, entry.signatures):
+            bucket = table[signature]
+            bucket.remove(entry_id)
+            if not bucket:
+                del table[signature]
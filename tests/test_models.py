@@ -0,0 +1,61 @@
+""" Unit tests for core models and cache keys """
+
+import pytest
+
+from src.models.core import ChunkIterator, EmbeddingCacheKey, QueryContext
+from src.services.cache import query_cache_key
+
+pytestmark = pytest.mark.unit
+
+
+class TestChunkIterator:
+    def test_batch_iter_returns_at_most_n_chunks(self):
+        chunks = ChunkIterator("a" * 25, chunk_size=10)
+
+        assert [c.chunk_id for c in chunks.batch_iter(2)] == ["chunk_0_10", "chunk_10_20"]
+        assert [c.chunk_id for c in chunks.batch_iter(2)] == ["chunk_20_25"]
+        assert chunks.batch_iter(2) == []
+
+    def test_chunks_cover_document_without_gaps(self):
+        document = "".join(str(i % 10) for i in range(2345))
+
+        chunks = list(ChunkIterator(document, chunk_size=1000))
+
+        assert "".join(c.content for c in chunks) == document
+        assert [(c.start_pos, c.end_pos) for c in chunks] == [(0, 1000), (1000, 2000), (2000, 2345)]
+
+
+class TestEmbeddingCacheKey:
+    def test_equal_keys_hash_equal(self):
+        a = EmbeddingCacheKey(content_hash="ab12", model_version="v1")
+        b = EmbeddingCacheKey(content_hash="ab12", model_version="v1")
+
+        assert a == b
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+
+    def test_model_version_is_part_of_the_key(self):
+        a = EmbeddingCacheKey(content_hash="ab12", model_version="v1")
+        b = EmbeddingCacheKey(content_hash="ab12", model_version="v2")
+
+        assert a != b
+
+    @pytest.mark.parametrize("content_hash, model_version", [("", "v1"), ("ab12", "")])
+    def test_empty_components_are_rejected(self, content_hash, model_version):
+        with pytest.raises(ValueError):
+            EmbeddingCacheKey(content_hash=content_hash, model_version=model_version)
+
+
+class TestQueryCacheKey:
+    def test_key_ignores_query_case_and_filter_order(self):
+        a = QueryContext(query="What is ROI", persona_id="enterprise_buyer", filter={"a": 1, "b": 2})
+        b = QueryContext(query="what is roi", persona_id="enterprise_buyer", filter={"b": 2, "a": 1})
+
+        assert query_cache_key(a) == query_cache_key(b)
+
+    @pytest.mark.parametrize("persona_id, filters", [("smb_decision_maker", {}), ("enterprise_buyer", {"a": 1})])
+    def test_key_depends_on_persona_and_filters(self, persona_id, filters):
+        base = QueryContext(query="what is roi", persona_id="enterprise_buyer", filter={})
+        other = QueryContext(query="what is roi", persona_id=persona_id, filter=filters)
+
+        assert query_cache_key(base) != query_cache_key(other)
@@ -0,0 +1,127 @@
+""" Unit tests for embedding batching and the semantic cache """
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.api.dependencies import MockEmbeddingService
+from src.models.core import QueryContext
+from src.services.batching import BatchingEmbedder
+from src.services.semantic_cache import SemanticCache
+
+pytestmark = pytest.mark.unit
+
+
+class _LengthEmbedder:
+    """ Embeds each text as [len(text)] so results can be matched to inputs """
+
+    def __init__(self):
+        self.calls = []
+
+    async def embed_batch(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        return np.array([[len(text)] for text in texts], dtype=np.float32)
+
+
+class TestBatchingEmbedder:
+    async def test_coalesces_concurrent_submissions(self):
+        provider = _LengthEmbedder()
+        batcher = BatchingEmbedder(provider, batch_size=8, flush_interval_ms=10)
+        await batcher.start()
+
+        embeddings = await batcher.submit_many(["a", "bb", "ccc"])
+        await batcher.close()
+
+        assert [float(e[0]) for e in embeddings] == [1.0, 2.0, 3.0]
+        assert provider.calls == [["a", "bb", "ccc"]]
+
+    async def test_close_flushes_partially_collected_batch(self):
+        provider = _LengthEmbedder()
+        batcher = BatchingEmbedder(provider, batch_size=8, flush_interval_ms=60000)
+        await batcher.start()
+
+        pending = [asyncio.create_task(batcher.submit(text)) for text in ("a", "bb")]
+        await asyncio.sleep(0.01)
+        await batcher.close()
+
+        results = await asyncio.wait_for(asyncio.gather(*pending), timeout=1)
+        assert [float(e[0]) for e in results] == [1.0, 2.0]
+
+    async def test_batch_size_one_bypasses_queue(self):
+        provider = _LengthEmbedder()
+        batcher = BatchingEmbedder(provider, batch_size=1)
+        await batcher.start()
+
+        embedding = await batcher.submit("abcd")
+
+        assert float(embedding[0]) == 4.0
+        assert provider.calls == [["abcd"]]
+
+
+class TestMockEmbeddingService:
+    async def test_embed_batch_keeps_input_order(self):
+        service = MockEmbeddingService()
+        # Tag each embedding with its text length so the un-permutation is observable
+        async def embed_documents(documents):
+            return np.array([[len(d)] * 2 for d in documents], dtype=np.float32)
+        service.embed_documents = embed_documents
+        texts = ["a", "cccc", "bb", "eeeeeeeeee", "ddd"]
+
+        embeddings = await service.embed_batch(texts, batch_size=2)
+
+        assert embeddings[:, 0].tolist() == [len(text) for text in texts]
+
+    async def test_embed_batch_of_nothing(self):
+        embeddings = await MockEmbeddingService().embed_batch([])
+
+        assert embeddings.shape[0] == 0
+
+
+def _context(persona_id="enterprise_buyer", filters=None):
+    return QueryContext(query="what is the roi", persona_id=persona_id, filter=filters or {})
+
+
+class TestSemanticCache:
+    def test_returns_answer_for_similar_query(self):
+        cache = SemanticCache(dim=16, threshold=0.95)
+        embedding = np.arange(1, 17, dtype=np.float32)
+        cache.store(_context(), embedding, "cached answer")
+
+        assert cache.lookup(_context(), embedding * 1.01 + 0.001) == "cached answer"
+
+    def test_misses_dissimilar_query(self):
+        cache = SemanticCache(dim=16, threshold=0.95)
+        cache.store(_context(), np.arange(1, 17, dtype=np.float32), "cached answer")
+
+        assert cache.lookup(_context(), -np.arange(1, 17, dtype=np.float32)) is None
+
+    def test_answers_are_scoped_to_persona_and_filters(self):
+        cache = SemanticCache(dim=16)
+        embedding = np.arange(1, 17, dtype=np.float32)
+        cache.store(_context(), embedding, "cached answer")
+
+        assert cache.lookup(_context(persona_id="smb_decision_maker"), embedding) is None
+        assert cache.lookup(_context(filters={"region": "emea"}), embedding) is None
+
+    def test_expired_entries_are_evicted_on_lookup(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("src.services.semantic_cache.time.monotonic", lambda: now[0])
+        cache = SemanticCache(dim=16, ttl_seconds=10)
+        embedding = np.arange(1, 17, dtype=np.float32)
+        for i in range(3):
+            cache.store(_context(), embedding, f"answer {i}")
+
+        now[0] += 11
+
+        assert cache.lookup(_context(), embedding) is None
+        assert len(cache) == 0
+
+    def test_capacity_evicts_oldest(self):
+        cache = SemanticCache(dim=16, max_entries=2)
+        for i in range(3):
+            cache.store(_context(), np.eye(16, dtype=np.float32)[i], f"answer {i}")
+
+        assert len(cache) == 2
+        assert cache.lookup(_context(), np.eye(16, dtype=np.float32)[0]) is None
+        assert cache.lookup(_context(), np.eye(16, dtype=np.float32)[2]) == "answer 2"